@@ -1,63 +1,189 @@
+import asyncio
+import heapq
 import time
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 
 
 class CacheManager:
     """Simple in-memory cache with TTL support."""
-    
-    def __init__(self, ttl_minutes: int):
-        self.cache: Dict[str, Dict[str, Any]] = {}
+
+    __slots__ = (
+        "_data", "_exp", "_json", "_validators", "_heap",
+        "ttl_seconds", "stale_seconds", "max_entries",
+    )
+
+    def __init__(self, ttl_minutes: int, max_entries: int = 1024, stale_minutes: int = 0):
+        # Payloads (in LRU order) and absolute expiry times, keyed identically
+        self._data: OrderedDict[str, Any] = OrderedDict()
+        self._exp: Dict[str, float] = {}
+        # Rendered tool output for an entry, so repeat hits skip re-serializing
+        self._json: Dict[str, str] = {}
+        # Upstream (ETag, Last-Modified) for entries that can be revalidated
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        # Min-heap of (expiry, key); may hold stale entries for overwritten keys
+        self._heap: List[Tuple[float, str]] = []
         self.ttl_seconds = ttl_minutes * 60
-    
-    def _is_expired(self, timestamp: float) -> bool:
-        """Check if a cache entry is expired."""
-        return time.time() - timestamp > self.ttl_seconds
-    
+        # How long expired entries with validators are kept for revalidation
+        self.stale_seconds = stale_minutes * 60
+        self.max_entries = max_entries
+
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get a value from cache if it exists and is not expired."""
-        if key not in self.cache:
+        exp = self._exp.get(key)
+        if exp is None:
             return None
-        
-        entry = self.cache[key]
-        if self._is_expired(entry["timestamp"]):
-            # Remove expired entry
-            del self.cache[key]
+        current = time.monotonic()
+        if exp < current:
+            # Remove expired entry unless it is kept around for revalidation
+            if self._deadline(key, exp) < current:
+                self._remove(key)
             return None
-        
-        return entry["data"]
-    
-    def set(self, key: str, data: Dict[str, Any]) -> None:
-        """Set a value in cache with current timestamp."""
-        self.cache[key] = {
-            "data": data,
-            "timestamp": time.time()
-        }
-    
+
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def get_stale(self, key: str) -> Optional[Tuple[Dict[str, Any], Optional[str], Optional[str]]]:
+        """Get (data, etag, last_modified) for an entry that can be revalidated upstream."""
+        validators = self._validators.get(key)
+        if validators is None:
+            return None
+
+        etag, last_modified = validators
+        return self._data[key], etag, last_modified
+
+    def get_serialized(self, key: str) -> Optional[str]:
+        """Get the serialized form of a cached value if present and not expired."""
+        exp = self._exp.get(key)
+        if exp is None or exp < time.monotonic():
+            return None
+
+        self._data.move_to_end(key)
+        return self._json.get(key)
+
+    def set(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Set a value in cache, expiring ttl_seconds from now.
+
+        Entries given an ETag or Last-Modified validator are kept for a further
+        stale_seconds after expiry so they can be revalidated instead of refetched.
+        Evicts the least recently used entries once max_entries is exceeded.
+        """
+        exp = time.monotonic() + self.ttl_seconds
+        self._data[key] = data
+        self._data.move_to_end(key)
+        self._exp[key] = exp
+        self._json.pop(key, None)
+        if (etag or last_modified) and self.stale_seconds > 0:
+            self._validators[key] = (etag, last_modified)
+        else:
+            self._validators.pop(key, None)
+        while len(self._data) > self.max_entries:
+            self._remove(next(iter(self._data)))
+
+        self._push(exp, key)
+
+    def refresh(
+        self,
+        key: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> bool:
+        """Extend an entry's expiry by ttl_seconds after a successful revalidation.
+
+        Validators sent with the 304 replace the stored ones; missing ones are kept.
+        Returns False if the entry has been evicted in the meantime.
+        """
+        if key not in self._data:
+            return False
+
+        validators = self._validators.get(key)
+        if validators is not None:
+            self._validators[key] = (etag or validators[0], last_modified or validators[1])
+
+        exp = time.monotonic() + self.ttl_seconds
+        self._data.move_to_end(key)
+        self._exp[key] = exp
+        self._push(exp, key)
+        return True
+
+    def set_serialized(self, key: str, serialized: str) -> None:
+        """Attach a serialized form to an existing cache entry."""
+        if key in self._data:
+            self._json[key] = serialized
+
+    def _push(self, exp: float, key: str) -> None:
+        """Schedule key for expiry, compacting the heap once it is mostly stale.
+
+        Overwrites, refreshes and LRU evictions leave superseded tuples behind;
+        rebuilding from _exp keeps the heap proportional to the live entries.
+        """
+        heapq.heappush(self._heap, (exp, key))
+        if len(self._heap) > 2 * len(self._exp):
+            self._heap = [(when, k) for k, when in self._exp.items()]
+            heapq.heapify(self._heap)
+
+    def _remove(self, key: str) -> None:
+        """Drop a key from all per-entry stores."""
+        self._data.pop(key, None)
+        self._exp.pop(key, None)
+        self._json.pop(key, None)
+        self._validators.pop(key, None)
+
+    def _deadline(self, key: str, exp: float) -> float:
+        """Return when an entry expiring at exp must be dropped from the cache."""
+        return exp + self.stale_seconds if key in self._validators else exp
+
     def clear(self) -> None:
         """Clear all cache entries."""
-        self.cache.clear()
-    
+        self._data.clear()
+        self._exp.clear()
+        self._json.clear()
+        self._validators.clear()
+        self._heap.clear()
+
     def cleanup_expired(self) -> int:
         """Remove all expired entries and return count of removed entries."""
-        expired_keys = [
-            key for key, entry in self.cache.items()
-            if self._is_expired(entry["timestamp"])
-        ]
-        
-        for key in expired_keys:
-            del self.cache[key]
-        
-        return len(expired_keys)
-    
+        current = time.monotonic()
+        removed = 0
+        while self._heap and self._heap[0][0] <= current:
+            when, key = heapq.heappop(self._heap)
+            # Skip heap entries superseded by a later set() or already evicted
+            exp = self._exp.get(key)
+            if exp is None or exp > current:
+                continue
+
+            deadline = self._deadline(key, exp)
+            if deadline <= current:
+                self._remove(key)
+                removed += 1
+            elif when == exp:
+                # Expired but revalidatable; check again once the stale window ends
+                heapq.heappush(self._heap, (deadline, key))
+
+        return removed
+
+    async def run_reaper(self) -> None:
+        """Remove expired entries in the background, waking at the next expiry."""
+        while True:
+            if self._heap:
+                delay = self._heap[0][0] - time.monotonic()
+            else:
+                # Nothing cached yet; new entries expire no sooner than one TTL out
+                delay = self.ttl_seconds
+            await asyncio.sleep(max(1.0, delay))
+            self.cleanup_expired()
+
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        total_entries = len(self.cache)
-        expired_count = self.cleanup_expired()
-        active_entries = len(self.cache)
-        
         return {
-            "total_entries": total_entries,
-            "active_entries": active_entries,
-            "expired_cleaned": expired_count,
-            "ttl_seconds": self.ttl_seconds
+            "total_entries": len(self._data),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds
         }
@@ -1,34 +1,49 @@
+import logging
 import os
 from dataclasses import dataclass
 from typing import Optional
 from dotenv import load_dotenv
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration settings for the MCP server."""
     api_key: Optional[str] = None
     base_url: str = "https://api.financialdatasets.ai"
     default_timeout: float = 30.0
+    max_response_bytes: int = 50 * 1024 * 1024
     health_check_timeout: float = 5.0
+    health_check_cache_seconds: float = 5.0
     log_level: str = "INFO"
+    log_level_no: int = logging.INFO
     transport_type: str = "stdio"
     host: str = "127.0.0.1"
     port: int = 8000
     cache_ttl_minutes: int = 10
+    cache_max_entries: int = 1024
+    cache_stale_minutes: int = 60
     
     @classmethod
     def from_env(cls) -> "Config":
         """Create config from environment variables."""
+        # Slotted dataclasses don't keep field defaults as class attributes
+        defaults = cls()
+        log_level = os.environ.get("LOG_LEVEL", defaults.log_level).upper()
         return cls(
             api_key=os.environ.get("FINANCIAL_DATASETS_API_KEY"),
-            base_url=os.environ.get("FINANCIAL_DATASETS_API_BASE", cls.base_url),
-            default_timeout=float(os.environ.get("API_TIMEOUT", cls.default_timeout)),
-            health_check_timeout=float(os.environ.get("HEALTH_CHECK_TIMEOUT", cls.health_check_timeout)),
-            log_level=os.environ.get("LOG_LEVEL", cls.log_level),
-            transport_type=os.environ.get("MCP_TRANSPORT", cls.transport_type),
-            host=os.environ.get("MCP_HOST", cls.host),
-            port=int(os.environ.get("MCP_PORT", cls.port)),
-            cache_ttl_minutes=int(os.environ.get("CACHE_TTL_MINUTES", cls.cache_ttl_minutes)),
+            base_url=os.environ.get("FINANCIAL_DATASETS_API_BASE", defaults.base_url),
+            default_timeout=float(os.environ.get("API_TIMEOUT", defaults.default_timeout)),
+            max_response_bytes=int(os.environ.get("MAX_RESPONSE_BYTES", defaults.max_response_bytes)),
+            health_check_timeout=float(os.environ.get("HEALTH_CHECK_TIMEOUT", defaults.health_check_timeout)),
+            health_check_cache_seconds=float(os.environ.get("HEALTH_CHECK_CACHE_SECONDS", defaults.health_check_cache_seconds)),
+            log_level=log_level,
+            # Unknown level names fall back to INFO instead of failing at import
+            log_level_no=logging.getLevelNamesMapping().get(log_level, logging.INFO),
+            transport_type=os.environ.get("MCP_TRANSPORT", defaults.transport_type),
+            host=os.environ.get("MCP_HOST", defaults.host),
+            port=int(os.environ.get("MCP_PORT", defaults.port)),
+            cache_ttl_minutes=int(os.environ.get("CACHE_TTL_MINUTES", defaults.cache_ttl_minutes)),
+            cache_max_entries=int(os.environ.get("CACHE_MAX_ENTRIES", defaults.cache_max_entries)),
+            cache_stale_minutes=int(os.environ.get("CACHE_STALE_MINUTES", defaults.cache_stale_minutes)),
         )
 
 # Load environment variables first
@@ -1,10 +1,14 @@
-import json
+import asyncio
 import os
 import httpx
+import orjson
 import logging
 import sys
 import time
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Any, Optional, Tuple
+from urllib.parse import urlencode
 from fastmcp import FastMCP
 from starlette.requests import Request
 from starlette.responses import PlainTextResponse, JSONResponse
@@ -13,72 +17,323 @@ from cache_manager import CacheManager
 
 # Configure logging to write to stderr
 logging.basicConfig(
-    level=getattr(logging, config.log_level),
+    level=config.log_level_no,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     stream=sys.stderr,
 )
 logger = logging.getLogger("financial-datasets-mcp")
 
+# Snapshot the settings read on every request so the hot path uses plain globals
+_API_KEY = config.api_key
+_BASE = config.base_url
+_TIMEOUT = config.default_timeout
+_MAX_RESPONSE_BYTES = config.max_response_bytes
+# Longest error body quoted back in an "HTTP <status> error" message
+_MAX_ERROR_BYTES = 4096
+_HEALTH_CHECK_TIMEOUT = config.health_check_timeout
+_HEALTH_CHECK_CACHE_SECONDS = config.health_check_cache_seconds
+_DEFAULT_HEADERS = {"X-API-KEY": _API_KEY} if _API_KEY else {}
+
+if not _API_KEY:
+    logger.warning("No API key found. Some endpoints may be rate-limited.")
+
+
+def _create_client() -> httpx.AsyncClient:
+    """Create the shared HTTP/2 client used for all Financial Datasets API calls."""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=_TIMEOUT,
+        headers=_DEFAULT_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+
+# Long-lived client so requests reuse pooled keep-alive connections
+client = _create_client()
+_active_sessions = 0
+_reaper_task: Optional[asyncio.Task] = None
+
+# (monotonic time, api_status) of the last upstream probe made by /health
+_last_probe: Optional[Tuple[float, str]] = None
+
+# Error payloads returned by make_request; callers must treat them as read-only
+_ERR_KEY = sys.intern("Error")
+_ERR_TIMEOUT = {_ERR_KEY: "Request timeout"}
+
+# Requests currently on the wire, so concurrent duplicates share one fetch
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, recreating it if a shutdown closed it."""
+    global client
+    if client.is_closed:
+        client = _create_client()
+    return client
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Run the cache reaper and close the shared HTTP client after the last session ends."""
+    global _active_sessions, _reaper_task
+    _active_sessions += 1
+    if _reaper_task is None:
+        _reaper_task = asyncio.create_task(cache.run_reaper())
+    try:
+        yield
+    finally:
+        _active_sessions -= 1
+        if _active_sessions == 0:
+            _reaper_task.cancel()
+            _reaper_task = None
+            await client.aclose()
+
+
 # Initialize FastMCP server and cache manager
-mcp = FastMCP("financial-datasets")
-cache = CacheManager(ttl_minutes=config.cache_ttl_minutes)
+mcp = FastMCP("financial-datasets", lifespan=lifespan)
+cache = CacheManager(
+    ttl_minutes=config.cache_ttl_minutes,
+    max_entries=config.cache_max_entries,
+    stale_minutes=config.cache_stale_minutes,
+)
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """An API endpoint served by a tool and the response field it returns."""
+    url: str
+    field: str
+    not_found: str
+    use_cache: bool = True
+
+
+# Endpoint table, bound once at import; query strings are appended with urlencode
+_INCOME_STATEMENTS = Endpoint(
+    f"{_BASE}/financials/income-statements/?",
+    "income_statements",
+    "Unable to fetch income statements or no income statements found.",
+)
+_BALANCE_SHEETS = Endpoint(
+    f"{_BASE}/financials/balance-sheets/?",
+    "balance_sheets",
+    "Unable to fetch balance sheets or no balance sheets found.",
+)
+_CASH_FLOW_STATEMENTS = Endpoint(
+    f"{_BASE}/financials/cash-flow-statements/?",
+    "cash_flow_statements",
+    "Unable to fetch cash flow statements or no cash flow statements found.",
+)
+_STOCK_SNAPSHOT = Endpoint(
+    f"{_BASE}/prices/snapshot/?",
+    "snapshot",
+    "Unable to fetch current price or no current price found.",
+    use_cache=False,
+)
+_STOCK_PRICES = Endpoint(
+    f"{_BASE}/prices/?",
+    "prices",
+    "Unable to fetch prices or no prices found.",
+)
+_NEWS = Endpoint(
+    f"{_BASE}/news/?",
+    "news",
+    "Unable to fetch news or no news found.",
+)
+_CRYPTO_TICKERS = Endpoint(
+    f"{_BASE}/crypto/prices/tickers",
+    "tickers",
+    "Unable to fetch available crypto tickers or no available crypto tickers found.",
+)
+_CRYPTO_PRICES = Endpoint(
+    f"{_BASE}/crypto/prices/?",
+    "prices",
+    "Unable to fetch prices or no prices found.",
+)
+_CRYPTO_SNAPSHOT = Endpoint(
+    f"{_BASE}/crypto/prices/snapshot/?",
+    "snapshot",
+    "Unable to fetch current price or no current price found.",
+    use_cache=False,
+)
+_FILINGS = Endpoint(
+    f"{_BASE}/filings/?",
+    "filings",
+    "Unable to fetch SEC filings or no SEC filings found.",
+)
 
 
 async def make_request(url: str, use_cache: bool = True) -> Dict[str, Any]:
-    """Make a request to the Financial Datasets API with proper error handling and caching."""
+    """Make a request to the Financial Datasets API with proper error handling and caching.
+
+    Concurrent calls for the same URL are collapsed into a single upstream request.
+    """
     # Check cache first if enabled
     if use_cache:
         cached_data = cache.get(url)
         if cached_data is not None:
-            logger.info(f"Cache hit for: {url}")
+            logger.info("Cache hit for: %s", url)
             return cached_data
-    
-    headers = {}
-    if config.api_key:
-        headers["X-API-KEY"] = config.api_key
+
+    # Join an identical request that is already in flight, or start one
+    task = _inflight.get(url)
+    if task is None:
+        task = asyncio.create_task(_fetch(url, use_cache))
+        _inflight[url] = task
+        task.add_done_callback(lambda done: _forget_inflight(url, done))
     else:
-        logger.warning("No API key found. Some endpoints may be rate-limited.")
+        logger.info("Joining in-flight request for: %s", url)
 
-    async with httpx.AsyncClient() as client:
-        try:
-            logger.info(f"Making request to: {url}")
-            response = await client.get(url, headers=headers, timeout=config.default_timeout)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Successfully retrieved data from {url}")
-            
-            # Cache the successful response if caching is enabled
-            if use_cache and "Error" not in data:
-                cache.set(url, data)
-                logger.debug(f"Cached response for: {url}")
-            
+    # The fetch runs as its own task and every caller, including the one that
+    # started it, awaits it through a shield, so cancelling any one caller
+    # neither aborts the fetch nor cancels the others
+    return await asyncio.shield(task)
+
+
+def _forget_inflight(url: str, task: asyncio.Task) -> None:
+    """Drop a finished fetch from the in-flight registry."""
+    if _inflight.get(url) is task:
+        del _inflight[url]
+
+
+async def fetch_endpoint(endpoint: Endpoint, params: Optional[Dict[str, Any]] = None) -> str:
+    """Fetch an endpoint and return its response field as indented JSON for a tool."""
+    url = endpoint.url + urlencode(params) if params else endpoint.url
+
+    # Serve the rendered result directly on a cache hit
+    if endpoint.use_cache:
+        cached = cache.get_serialized(url)
+        if cached is not None:
+            return cached
+
+    data = await make_request(url, use_cache=endpoint.use_cache)
+
+    # Extract the requested field and check that something was found
+    items = data.get(endpoint.field) if data else None
+    if not items:
+        return endpoint.not_found
+
+    return render_result(url, items)
+
+
+def render_result(url: str, payload: Any) -> str:
+    """Serialize a tool result and keep it with the cached response for url."""
+    result = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+    cache.set_serialized(url, result)
+    return result
+
+
+async def _fetch(url: str, use_cache: bool) -> Dict[str, Any]:
+    """Perform the upstream GET for make_request and cache successful responses."""
+    # Make the request conditional if an expired copy can be revalidated
+    stale = cache.get_stale(url) if use_cache else None
+    headers = {}
+    if stale is not None:
+        _, etag, last_modified = stale
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    try:
+        logger.info("Making request to: %s", url)
+        # Bound the whole download, not just each read, by the request timeout
+        async with asyncio.timeout(_TIMEOUT):
+            body, response_headers = await _read_body(url, headers)
+
+        if body is None:
+            # 304 Not Modified: the cached copy is still current, though the
+            # response may carry updated validators
+            data, etag, last_modified = stale
+            etag = response_headers.get("etag") or etag
+            last_modified = response_headers.get("last-modified") or last_modified
+            if not cache.refresh(url, etag=etag, last_modified=last_modified):
+                cache.set(url, data, etag=etag, last_modified=last_modified)
+            logger.info("Revalidated cached response for: %s", url)
             return data
-            
-        except httpx.HTTPStatusError as e:
-            error_msg = f"HTTP {e.response.status_code} error: {e.response.text}"
-            logger.error(error_msg)
-            return {"Error": error_msg}
-        except httpx.TimeoutException:
-            error_msg = "Request timeout"
-            logger.error(error_msg)
-            return {"Error": error_msg}
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            logger.error(error_msg)
-            return {"Error": error_msg}
+        
+        data = orjson.loads(body)
+        logger.info("Successfully retrieved data from %s", url)
+        
+        # Cache the successful response if caching is enabled
+        if use_cache and _ERR_KEY not in data:
+            cache.set(
+                url,
+                data,
+                etag=response_headers.get("etag"),
+                last_modified=response_headers.get("last-modified"),
+            )
+            logger.debug("Cached response for: %s", url)
+        
+        return data
+        
+    except httpx.HTTPStatusError as e:
+        error_msg = str(e)
+        logger.error(error_msg)
+        return {_ERR_KEY: error_msg}
+    except (httpx.TimeoutException, TimeoutError):
+        logger.error("Request timeout")
+        return _ERR_TIMEOUT
+    except Exception as e:
+        error_msg = f"Unexpected error: {str(e)}"
+        logger.error(error_msg)
+        return {_ERR_KEY: error_msg}
+
+
+async def _read_body(
+    url: str, headers: Dict[str, str]
+) -> Tuple[Optional[bytearray], httpx.Headers]:
+    """Stream a GET response body, refusing bodies larger than the configured limit.
+
+    The body is None when a conditional request is answered with 304 Not Modified.
+    """
+    async with get_client().stream("GET", url, headers=headers) as response:
+        if response.status_code == 304 and headers:
+            return None, response.headers
+
+        if not response.is_success:
+            # Keep only a short prefix of the error body for the message, so a
+            # failing upstream cannot make us buffer an unbounded response
+            limit = min(_MAX_ERROR_BYTES, _MAX_RESPONSE_BYTES)
+            prefix = bytearray()
+            async for chunk in response.aiter_bytes():
+                prefix += chunk
+                if len(prefix) > limit:
+                    break
+            text = prefix[:limit].decode(response.encoding or "utf-8", errors="replace")
+            if len(prefix) > limit:
+                text += "..."
+            raise httpx.HTTPStatusError(
+                f"HTTP {response.status_code} error: {text}",
+                request=response.request,
+                response=response,
+            )
+
+        # Append into one buffer that orjson can parse in place, rather than
+        # joining a list of chunks into a second full-size copy
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) > _MAX_RESPONSE_BYTES:
+                raise ValueError(f"Response exceeds {_MAX_RESPONSE_BYTES} bytes")
+
+    return body, response.headers
+
 
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request: Request) -> PlainTextResponse:
     """Enhanced health check with API connectivity test and cache status."""
-    try:
-        # Test API connectivity
-        test_url = f"{config.base_url}"
-        async with httpx.AsyncClient() as client:
-            response = await client.get(test_url, timeout=config.health_check_timeout)
+    global _last_probe
+    # Reuse a recent probe result so frequent polling does not hit the API each time
+    if _last_probe is not None and time.monotonic() - _last_probe[0] < _HEALTH_CHECK_CACHE_SECONDS:
+        api_status = _last_probe[1]
+    else:
+        try:
+            # Test API connectivity
+            response = await get_client().get(_BASE, timeout=_HEALTH_CHECK_TIMEOUT)
             api_status = "OK" if response.status_code == 200 else "DEGRADED"
-    except Exception:
-        api_status = "ERROR"
+        except Exception:
+            api_status = "ERROR"
+        _last_probe = (time.monotonic(), api_status)
     
     # Get cache statistics
     try:
@@ -97,7 +352,7 @@ async def health_check(request: Request) -> PlainTextResponse:
         "version": "0.2.0"
     }
     
-    return PlainTextResponse(json.dumps(health_data))
+    return PlainTextResponse(orjson.dumps(health_data))
 
 @mcp.tool()
 async def get_income_statements(
@@ -112,23 +367,7 @@ async def get_income_statements(
         period: Period of the income statement (e.g. annual, quarterly, ttm)
         limit: Number of income statements to return (default: 4)
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/financials/income-statements/?ticker={ticker}&period={period}&limit={limit}"
-    data = await make_request(url)
-
-    # Check if data is found
-    if not data:
-        return "Unable to fetch income statements or no income statements found."
-
-    # Extract the income statements
-    income_statements = data.get("income_statements", [])
-
-    # Check if income statements are found
-    if not income_statements:
-        return "Unable to fetch income statements or no income statements found."
-
-    # Stringify the income statements
-    return json.dumps(income_statements, indent=2)
+    return await fetch_endpoint(_INCOME_STATEMENTS, {"ticker": ticker, "period": period, "limit": limit})
 
 
 @mcp.tool()
@@ -145,23 +384,7 @@ async def get_balance_sheets(
         limit: Number of balance sheets to return (default: 4)
         use_cache: Whether to use cached data if available (default: True)
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/financials/balance-sheets/?ticker={ticker}&period={period}&limit={limit}"
-    data = await make_request(url)
-
-    # Check if data is found
-    if not data:
-        return "Unable to fetch balance sheets or no balance sheets found."
-
-    # Extract the balance sheets
-    balance_sheets = data.get("balance_sheets", [])
-
-    # Check if balance sheets are found
-    if not balance_sheets:
-        return "Unable to fetch balance sheets or no balance sheets found."
-
-    # Stringify the balance sheets
-    return json.dumps(balance_sheets, indent=2)
+    return await fetch_endpoint(_BALANCE_SHEETS, {"ticker": ticker, "period": period, "limit": limit})
 
 
 @mcp.tool()
@@ -177,23 +400,39 @@ async def get_cash_flow_statements(
         period: Period of the cash flow statement (e.g. annual, quarterly, ttm)
         limit: Number of cash flow statements to return (default: 4)
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/financials/cash-flow-statements/?ticker={ticker}&period={period}&limit={limit}"
-    data = await make_request(url)
+    return await fetch_endpoint(_CASH_FLOW_STATEMENTS, {"ticker": ticker, "period": period, "limit": limit})
+
+
+@mcp.tool()
+async def get_financials_bundle(
+    ticker: str,
+    period: str = "annual",
+    limit: int = 4,
+) -> str:
+    """Get income statements, balance sheets and cash flow statements for a company in one call.
 
-    # Check if data is found
-    if not data:
-        return "Unable to fetch cash flow statements or no cash flow statements found."
+    Args:
+        ticker: Ticker symbol of the company (e.g. AAPL, GOOGL)
+        period: Period of the statements (e.g. annual, quarterly, ttm)
+        limit: Number of statements of each kind to return (default: 4)
+    """
+    params = {"ticker": ticker, "period": period, "limit": limit}
+    endpoints = (_INCOME_STATEMENTS, _BALANCE_SHEETS, _CASH_FLOW_STATEMENTS)
 
-    # Extract the cash flow statements
-    cash_flow_statements = data.get("cash_flow_statements", [])
+    # Fetch all three statements concurrently; each shares the single-tool cache entries
+    results = await asyncio.gather(
+        *(make_request(endpoint.url + urlencode(params)) for endpoint in endpoints)
+    )
 
-    # Check if cash flow statements are found
-    if not cash_flow_statements:
-        return "Unable to fetch cash flow statements or no cash flow statements found."
+    # Report a failed or empty statement explicitly rather than as an empty list
+    bundle = {}
+    for endpoint, data in zip(endpoints, results):
+        if _ERR_KEY in data:
+            bundle[endpoint.field] = {_ERR_KEY: data[_ERR_KEY]}
+        else:
+            bundle[endpoint.field] = data.get(endpoint.field) or endpoint.not_found
 
-    # Stringify the cash flow statements
-    return json.dumps(cash_flow_statements, indent=2)
+    return orjson.dumps(bundle, option=orjson.OPT_INDENT_2).decode()
 
 
 @mcp.tool()
@@ -204,23 +443,7 @@ async def get_current_stock_price(ticker: str) -> str:
         ticker: Ticker symbol of the company (e.g. AAPL, GOOGL)
         use_cache: Whether to use cached data if available (default: False for real-time data)
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/prices/snapshot/?ticker={ticker}"
-    data = await make_request(url, use_cache=False)
-
-    # Check if data is found
-    if not data:
-        return "Unable to fetch current price or no current price found."
-
-    # Extract the current price
-    snapshot = data.get("snapshot", {})
-
-    # Check if current price is found
-    if not snapshot:
-        return "Unable to fetch current price or no current price found."
-
-    # Stringify the current price
-    return json.dumps(snapshot, indent=2)
+    return await fetch_endpoint(_STOCK_SNAPSHOT, {"ticker": ticker})
 
 
 @mcp.tool()
@@ -240,23 +463,13 @@ async def get_historical_stock_prices(
         interval: Interval of the price data (e.g. minute, hour, day, week, month)
         interval_multiplier: Multiplier of the interval (e.g. 1, 2, 3)
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/prices/?ticker={ticker}&interval={interval}&interval_multiplier={interval_multiplier}&start_date={start_date}&end_date={end_date}"
-    data = await make_request(url)
-
-    # Check if data is found
-    if not data:
-        return "Unable to fetch prices or no prices found."
-
-    # Extract the prices
-    prices = data.get("prices", [])
-
-    # Check if prices are found
-    if not prices:
-        return "Unable to fetch prices or no prices found."
-
-    # Stringify the prices
-    return json.dumps(prices, indent=2)
+    return await fetch_endpoint(_STOCK_PRICES, {
+        "ticker": ticker,
+        "interval": interval,
+        "interval_multiplier": interval_multiplier,
+        "start_date": start_date,
+        "end_date": end_date,
+    })
 
 
 @mcp.tool()
@@ -266,21 +479,7 @@ async def get_company_news(ticker: str) -> str:
     Args:
         ticker: Ticker symbol of the company (e.g. AAPL, GOOGL)
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/news/?ticker={ticker}"
-    data = await make_request(url)
-
-    # Check if data is found
-    if not data:
-        return "Unable to fetch news or no news found."
-
-    # Extract the news
-    news = data.get("news", [])
-
-    # Check if news are found
-    if not news:
-        return "Unable to fetch news or no news found."
-    return json.dumps(news, indent=2)
+    return await fetch_endpoint(_NEWS, {"ticker": ticker})
 
 
 @mcp.tool()
@@ -288,19 +487,7 @@ async def get_available_crypto_tickers() -> str:
     """
     Gets all available crypto tickers.
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/crypto/prices/tickers"
-    data = await make_request(url)
-
-    # Check if data is found
-    if not data:
-        return "Unable to fetch available crypto tickers or no available crypto tickers found."
-
-    # Extract the available crypto tickers
-    tickers = data.get("tickers", [])
-
-    # Stringify the available crypto tickers
-    return json.dumps(tickers, indent=2)
+    return await fetch_endpoint(_CRYPTO_TICKERS)
 
 
 @mcp.tool()
@@ -314,23 +501,13 @@ async def get_crypto_prices(
     """
     Gets historical prices for a crypto currency.
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/crypto/prices/?ticker={ticker}&interval={interval}&interval_multiplier={interval_multiplier}&start_date={start_date}&end_date={end_date}"
-    data = await make_request(url)
-
-    # Check if data is found
-    if not data:
-        return "Unable to fetch prices or no prices found."
-
-    # Extract the prices
-    prices = data.get("prices", [])
-
-    # Check if prices are found
-    if not prices:
-        return "Unable to fetch prices or no prices found."
-
-    # Stringify the prices
-    return json.dumps(prices, indent=2)
+    return await fetch_endpoint(_CRYPTO_PRICES, {
+        "ticker": ticker,
+        "interval": interval,
+        "interval_multiplier": interval_multiplier,
+        "start_date": start_date,
+        "end_date": end_date,
+    })
 
 
 @mcp.tool()
@@ -350,23 +527,13 @@ async def get_historical_crypto_prices(
         interval: Interval of the price data (e.g. minute, hour, day, week, month)
         interval_multiplier: Multiplier of the interval (e.g. 1, 2, 3)
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/crypto/prices/?ticker={ticker}&interval={interval}&interval_multiplier={interval_multiplier}&start_date={start_date}&end_date={end_date}"
-    data = await make_request(url)
-
-    # Check if data is found
-    if not data:
-        return "Unable to fetch prices or no prices found."
-
-    # Extract the prices
-    prices = data.get("prices", [])
-
-    # Check if prices are found
-    if not prices:
-        return "Unable to fetch prices or no prices found."
-
-    # Stringify the prices
-    return json.dumps(prices, indent=2)
+    return await fetch_endpoint(_CRYPTO_PRICES, {
+        "ticker": ticker,
+        "interval": interval,
+        "interval_multiplier": interval_multiplier,
+        "start_date": start_date,
+        "end_date": end_date,
+    })
 
 
 @mcp.tool()
@@ -377,23 +544,7 @@ async def get_current_crypto_price(ticker: str) -> str:
         ticker: Ticker symbol of the crypto currency (e.g. BTC-USD). The list of available crypto tickers can be retrieved via the get_available_crypto_tickers tool.
         use_cache: Whether to use cached data if available (default: False for real-time data)
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/crypto/prices/snapshot/?ticker={ticker}"
-    data = await make_request(url, use_cache=False)
-
-    # Check if data is found
-    if not data:
-        return "Unable to fetch current price or no current price found."
-
-    # Extract the current price
-    snapshot = data.get("snapshot", {})
-
-    # Check if current price is found
-    if not snapshot:
-        return "Unable to fetch current price or no current price found."
-
-    # Stringify the current price
-    return json.dumps(snapshot, indent=2)
+    return await fetch_endpoint(_CRYPTO_SNAPSHOT, {"ticker": ticker})
 
 
 @mcp.tool()
@@ -409,23 +560,10 @@ async def get_sec_filings(
         limit: Number of SEC filings to return (default: 10)
         filing_type: Type of SEC filing (e.g. 10-K, 10-Q, 8-K)
     """
-    # Fetch data from the API
-    url = f"{config.base_url}/filings/?ticker={ticker}&limit={limit}"
+    params = {"ticker": ticker, "limit": limit}
     if filing_type:
-        url += f"&filing_type={filing_type}"
- 
-    # Call the API
-    data = await make_request(url)
-
-    # Extract the SEC filings
-    filings = data.get("filings", [])
-
-    # Check if SEC filings are found
-    if not filings:
-        return f"Unable to fetch SEC filings or no SEC filings found."
-
-    # Stringify the SEC filings
-    return json.dumps(filings, indent=2)
+        params["filing_type"] = filing_type
+    return await fetch_endpoint(_FILINGS, params)
 
 @mcp.custom_route("/cache/status", methods=["GET"])
 async def cache_status(request: Request) -> JSONResponse:
@@ -435,12 +573,14 @@ async def cache_status(request: Request) -> JSONResponse:
         cache_data = {
             "cache_enabled": True,
             "cache_ttl_minutes": config.cache_ttl_minutes,
+            "cache_max_entries": config.cache_max_entries,
+            "cache_stale_minutes": config.cache_stale_minutes,
             "statistics": stats,
             "timestamp": time.time()
         }
         return JSONResponse(cache_data)
     except Exception as e:
-        logger.error(f"Error getting cache status: {str(e)}")
+        logger.error("Error getting cache status: %s", e)
         return JSONResponse(
             {"error": f"Failed to get cache status: {str(e)}"}, 
             status_code=500
@@ -457,7 +597,7 @@ async def cache_clear(request: Request) -> JSONResponse:
             "timestamp": time.time()
         })
     except Exception as e:
-        logger.error(f"Error clearing cache: {str(e)}")
+        logger.error("Error clearing cache: %s", e)
         return JSONResponse(
             {"error": f"Failed to clear cache: {str(e)}"}, 
             status_code=500
@@ -468,14 +608,14 @@ async def cache_cleanup(request: Request) -> JSONResponse:
     """Clean up expired cache entries."""
     try:
         expired_count = cache.cleanup_expired()
-        logger.info(f"Cache cleanup completed, removed {expired_count} expired entries")
+        logger.info("Cache cleanup completed, removed %s expired entries", expired_count)
         return JSONResponse({
             "message": f"Cache cleanup completed",
             "expired_entries_removed": expired_count,
             "timestamp": time.time()
         })
     except Exception as e:
-        logger.error(f"Error cleaning up cache: {str(e)}")
+        logger.error("Error cleaning up cache: %s", e)
         return JSONResponse(
             {"error": f"Failed to cleanup cache: {str(e)}"}, 
             status_code=500
@@ -484,8 +624,9 @@ async def cache_cleanup(request: Request) -> JSONResponse:
 if __name__ == "__main__":
     # Log server startup
     logger.info("Starting Financial Datasets MCP Server...")
-    logger.info(f"Cache enabled with TTL: {config.cache_ttl_minutes} minutes")
-    logger.info(f"Transport type: {config.transport_type}")
+    logger.info("Cache enabled with TTL: %s minutes", config.cache_ttl_minutes)
+    logger.info("Cache size limit: %s entries", config.cache_max_entries)
+    logger.info("Transport type: %s", config.transport_type)
 
     # Initialize and run the server
     if config.transport_type == "streamable-http":